@@ -1,22 +1,48 @@
+import os
+from collections import OrderedDict
+from itertools import islice
+from threading import Lock
+
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from typing import List
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from lexer_no_ai import Lexer
 
+try:
+    # Compiled scanner, available after `cythonize -i lexer_fast.pyx`
+    from lexer_fast import tokenize
+except ImportError:
+    def tokenize(code):
+        return Lexer(code).tokenize()
+
 app = FastAPI(title="Lexer (no AI)")
 
+# Cross-origin callers are limited to the GitHub Pages frontend by default;
+# the /web UI served below is same-origin and needs no CORS. Override with
+# a comma-separated CORS_ORIGINS.
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get("CORS_ORIGINS", "https://chandresh202004.github.io").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Token lists are highly repetitive JSON and compress several times over
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Serve static files
 app.mount("/web", StaticFiles(directory="web", html=True), name="web")
 
@@ -25,12 +51,6 @@ app.mount("/web", StaticFiles(directory="web", html=True), name="web")
 async def root():
     return RedirectResponse(url="/web/")  # you can replace with a RedirectResponse if you want
 
-class TokenOut(BaseModel):
-    type: str
-    value: str
-    line: int
-    column: int
-
 class SourceIn(BaseModel):
     code: str
 
@@ -38,11 +58,77 @@ class SourceIn(BaseModel):
 async def health():
     return {"status": "ok"}
 
-@app.post("/api/lex", response_model=List[TokenOut])
+# Tokens are returned as plain dicts and serialized by orjson directly,
+# skipping a pydantic model per token.
+def lex_json(code):
+    return orjson.dumps([
+        {"type": t.type, "value": t.value, "line": t.line, "column": t.column}
+        for t in tokenize(code)
+    ])
+
+# Identical sources (the UI resubmitting the same buffer) are answered from
+# the serialized body. The cache is bounded by bytes, not entry count: a
+# small source can still serialize to megabytes of JSON.
+MAX_CACHED_SOURCE = 64 * 1024
+MAX_CACHED_BODY = 1024 * 1024
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+class ResponseCache:
+    # LRU of serialized bodies keyed by source, evicting oldest entries
+    # once source lengths plus body sizes exceed max_bytes in total.
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = Lock()  # filled from threadpool workers
+
+    def get(self, code):
+        with self.lock:
+            body = self.entries.get(code)
+            if body is not None:
+                self.entries.move_to_end(code)
+            return body
+
+    def put(self, code, body):
+        with self.lock:
+            if code in self.entries:
+                return
+            self.entries[code] = body
+            self.size += len(code) + len(body)
+            while self.size > self.max_bytes:
+                old_code, old_body = self.entries.popitem(last=False)
+                self.size -= len(old_code) + len(old_body)
+
+response_cache = ResponseCache(MAX_CACHE_BYTES)
+
+def cached_lex_json(code):
+    body = response_cache.get(code)
+    if body is None:
+        body = lex_json(code)
+        if len(body) <= MAX_CACHED_BODY:
+            response_cache.put(code, body)
+    return body
+
+@app.post("/api/lex")
 async def lex(source: SourceIn):
-    lexer = Lexer(source.code)
-    tokens = lexer.tokenize()
-    return [
-        TokenOut(type=t.type, value=t.value, line=t.line, column=t.column)
-        for t in tokens if t.type != "NEWLINE"
-    ]
\ No newline at end of file
+    code = source.code
+    render = cached_lex_json if len(code) <= MAX_CACHED_SOURCE else lex_json
+    # Tokenizing is CPU-bound; run it in the threadpool so it does not
+    # block the event loop for other in-flight requests.
+    body = await run_in_threadpool(render, code)
+    return Response(body, media_type="application/json")
+
+# Streams one JSON token per line as the lexer produces them, so a large
+# source never has its full token list in memory. Tokens are sent in
+# batches to keep the per-chunk threadpool hop off the per-token path.
+def ndjson_chunks(code, batch_size=1000):
+    tokens = Lexer(code).iter_tokens()
+    while batch := list(islice(tokens, batch_size)):
+        yield b"".join(
+            orjson.dumps({"type": t.type, "value": t.value, "line": t.line, "column": t.column}) + b"\n"
+            for t in batch
+        )
+
+@app.post("/api/lex/stream")
+async def lex_stream(source: SourceIn):
+    return StreamingResponse(ndjson_chunks(source.code), media_type="application/x-ndjson")
\ No newline at end of file
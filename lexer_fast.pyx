@@ -0,0 +1,155 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# ==================== COMPILED SCANNER ====================
+# Same token rules as Lexer.tokenize in lexer_no_ai.py, scanned over the
+# str buffer with C integers instead of interpreted per-char steps.
+# Build in place with:  cythonize -i lexer_fast.pyx
+from sys import intern
+
+from lexer_no_ai import DIRECTIVE_RE, KEYWORDS, MAX_INTERNED_IDENTIFIER, Token
+
+cdef frozenset _KEYWORDS = KEYWORDS
+
+
+cdef inline bint is_operator(Py_UCS4 c):
+    return c in u"+-*/%=<>!&|^~?:@"
+
+
+cdef inline bint is_delimiter(Py_UCS4 c):
+    return c in u"(){}[];,."
+
+
+cdef inline bint is_operator_pair(Py_UCS4 c, Py_UCS4 d):
+    if c == u'=' or c == u'!':
+        return d == u'='
+    if c == u'<' or c == u'>':
+        return d == u'=' or d == c
+    if c == u'&' or c == u'|':
+        return d == c
+    if c == u'+':
+        return d == u'+' or d == u'='
+    if c == u'-':
+        return d == u'-' or d == u'=' or d == u'>'
+    if c == u'*':
+        return d == u'=' or d == u'*'
+    if c == u'/':
+        return d == u'='
+    return False
+
+
+def tokenize(unicode source):
+    cdef Py_ssize_t n = len(source)
+    cdef Py_ssize_t pos = 0, start, k
+    cdef Py_ssize_t line = 1, line_start = 0, column
+    cdef Py_UCS4 c, d
+    cdef bint is_float, multiline, is_word
+    cdef list tokens = []
+
+    while pos < n:
+        c = source[pos]
+
+        # --- Whitespace / newline ---
+        if c == u' ' or c == u'\t' or c == u'\r':
+            pos += 1
+            continue
+        if c == u'\n':
+            pos += 1
+            line += 1
+            line_start = pos
+            continue
+
+        start = pos
+        column = start - line_start + 1
+        multiline = False
+        is_word = False
+
+        # --- Preprocessor or Python comment (DIRECTIVE_RE, as in lex_hash) ---
+        if c == u'#':
+            if DIRECTIVE_RE.match(source, start) and not source[line_start:start].strip(u' \t\r'):
+                token_type = "PREPROCESSOR"
+            else:
+                token_type = "COMMENT"
+            while pos < n and source[pos] != u'\n':
+                pos += 1
+
+        # --- Comments ---
+        elif c == u'/' and pos + 1 < n and source[pos + 1] == u'/':
+            while pos < n and source[pos] != u'\n':
+                pos += 1
+            token_type = "COMMENT"
+        elif c == u'/' and pos + 1 < n and source[pos + 1] == u'*':
+            pos += 2
+            while pos + 1 < n and not (source[pos] == u'*' and source[pos + 1] == u'/'):
+                pos += 1
+            pos = pos + 2 if pos + 1 < n else n
+            token_type = "COMMENT"
+            multiline = True
+
+        # --- Numbers ---
+        elif c.isdigit():
+            is_float = False
+            while pos < n:
+                d = source[pos]
+                if d == u'.':
+                    if is_float:
+                        break
+                    is_float = True
+                elif not d.isdigit():
+                    break
+                pos += 1
+            token_type = "FLOAT" if is_float else "INTEGER"
+
+        # --- Identifiers / Keywords ---
+        elif c.isalpha() or c == u'_':
+            while pos < n:
+                d = source[pos]
+                if not (d.isalnum() or d == u'_'):
+                    break
+                pos += 1
+            token_type = "KEYWORD" if source[start:pos] in _KEYWORDS else "IDENTIFIER"
+            is_word = True
+
+        # --- Strings ---
+        elif c == u'"' or c == u"'":
+            pos += 1
+            while pos < n:
+                d = source[pos]
+                if d == c:
+                    pos += 1
+                    break
+                pos += 2 if d == u'\\' else 1
+            if pos > n:
+                pos = n
+            token_type = "STRING"
+            multiline = True
+
+        # --- Operators ---
+        elif is_operator(c):
+            if pos + 1 < n and is_operator_pair(c, source[pos + 1]):
+                pos += 2
+            else:
+                pos += 1
+            token_type = "OPERATOR"
+
+        # --- Delimiters ---
+        elif is_delimiter(c):
+            pos += 1
+            token_type = "DELIMITER"
+
+        # --- Unknown ---
+        else:
+            pos += 1
+            token_type = "UNKNOWN"
+
+        # Token is a namedtuple; build it without going through its Python-level __new__
+        value = source[start:pos]
+        if is_word and pos - start <= MAX_INTERNED_IDENTIFIER:
+            value = intern(value)
+        tokens.append(tuple.__new__(Token, (token_type, value, line, column)))
+
+        if multiline:
+            for k in range(start, pos):
+                if source[k] == u'\n':
+                    line += 1
+                    line_start = k + 1
+
+    return tokens
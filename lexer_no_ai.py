@@ -1,247 +1,326 @@
+import re
 import sys
+from collections import namedtuple
 
 # ==================== TOKEN TYPES ====================
-TOKEN_TYPES = {
-    "KEYWORD": [
-        "auto", "break", "case", "char", "const", "continue", "default", "do",
-        "double", "else", "enum", "extern", "float", "for", "goto", "if",
-        "int", "long", "register", "return", "short", "signed", "sizeof", "static",
-        "struct", "switch", "typedef", "union", "unsigned", "void", "volatile", "while",
-        "print", "input", "def", "class", "import", "from", "as", "try", "except",
-        "finally", "raise", "with", "yield", "lambda", "pass", "True", "False", "None",
-        "and", "or", "not", "in", "is", "elif"
-    ]
-}
+KEYWORDS = frozenset({
+    "auto", "break", "case", "char", "const", "continue", "default", "do",
+    "double", "else", "enum", "extern", "float", "for", "goto", "if",
+    "int", "long", "register", "return", "short", "signed", "sizeof", "static",
+    "struct", "switch", "typedef", "union", "unsigned", "void", "volatile", "while",
+    "print", "input", "def", "class", "import", "from", "as", "try", "except",
+    "finally", "raise", "with", "yield", "lambda", "pass", "True", "False", "None",
+    "and", "or", "not", "in", "is", "elif"
+})
+
+# ==================== KEYWORD TRIE ====================
+def build_trie(words):
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True  # a keyword ends here
+    return trie
+
+def trie_pattern(node):
+    # Render a trie as a regex alternation that shares common prefixes,
+    # e.g. {"in", "int", "input"} -> in(?:(?:put|t))?
+    branches = [re.escape(ch) + trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return "(?:" + pattern + ")?" if "" in node else pattern
+
+KEYWORD_TRIE = build_trie(KEYWORDS)
+
+# Token bodies matched by the C regex engine instead of a Python loop.
+# \w is exactly str.isalnum() plus '_', the identifier rule. The keyword
+# trie is tried first, so a word is classified in the same scan that
+# finds its end.
+IDENTIFIER_RE = re.compile(r"(?P<KEYWORD>" + trie_pattern(KEYWORD_TRIE) + r")\b|(?P<IDENTIFIER>\w+)")
+WHITESPACE_RE = re.compile(r"[ \t\r]+")
+BLANK_RE = re.compile(r"[ \t\r\n]+")
+# A directive written straight after '#' is taken as C. With a space in
+# between ("# if ...") it could as easily open a Python comment, so the
+# spaced form also needs a directive-shaped operand: a header, an
+# UPPER_CASE macro name, a bare #else/#endif, and so on.
+DIRECTIVE_RE = re.compile(r"""
+    \#(?:include|define|undef|ifdef|ifndef|if|elif|else|endif|pragma|error|warning|line)\b
+  | \#[ \t]+(?:
+        include[ \t]*[<"]
+      | (?:define|undef|ifdef|ifndef)[ \t]+[A-Z_][A-Z0-9_]*\b
+      | (?:if|elif)[ \t]+(?:defined\b|[!(0-9]|[A-Z_][A-Z0-9_]*\b)
+      | (?:else|endif)[ \t]*(?:$|//|/\*)
+      | pragma[ \t]+[A-Za-z_]
+      | line[ \t]+[0-9]+[ \t]*(?:$|")
+    )
+""", re.VERBOSE | re.MULTILINE)
+
+# Token types by IDENTIFIER_RE group number. Group names are not interned
+# by re, so map them onto the interned strings the rest of the code uses.
+IDENTIFIER_TYPES = {index: sys.intern(name) for name, index in IDENTIFIER_RE.groupindex.items()}
+
+# Identifiers up to this length are interned, so repeated names like
+# i, x or printf share one str across every token that holds them.
+MAX_INTERNED_IDENTIFIER = 16
+
+UTF32_NATIVE = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+# Character-class tables for codes 0-255, indexed by character code so the
+# hot paths skip a str method call per character. Codes >= 256 still go
+# through str.isdigit()/str.isalpha().
+IS_DIGIT = bytes(chr(i).isdigit() for i in range(256))
+IS_IDENT_START = bytes(chr(i).isalpha() or chr(i) == "_" for i in range(256))
 
 # ==================== TOKEN CLASS ====================
-class Token:
-    def __init__(self, token_type, value, line, column):
-        self.type = token_type
-        self.value = value
-        self.line = line
-        self.column = column
+class Token(namedtuple("Token", ["type", "value", "line", "column"])):
+    __slots__ = ()
 
     def __str__(self):
         return f"| {self.type:<16} | {self.value:<30} | Ln {self.line:<4} Col {self.column:<4} |"
 
 # ==================== LEXER CLASS ====================
 class Lexer:
+    SINGLE_OPS = frozenset("+-*/%=<>!&|^~?:@")
+    DELIMITERS = frozenset("(){}[];,.")
+
+    # Multi-character operators: first char -> chars that may follow it
+    OP2 = {
+        "=": frozenset("="), "!": frozenset("="), "<": frozenset("=<"), ">": frozenset("=>"),
+        "&": frozenset("&"), "|": frozenset("|"), "+": frozenset("+="), "-": frozenset("-=>"),
+        "*": frozenset("=*"),
+    }
+
     def __init__(self, source):
         self.source = source
         self.pos = 0
         self.line = 1
-        self.column = 1
-        self.tokens = []
-
-    def current_char(self):
-        if self.pos < len(self.source):
-            return self.source[self.pos]
-        return None
-
-    def peek_char(self):
-        if self.pos + 1 < len(self.source):
-            return self.source[self.pos + 1]
-        return None
-
-    def advance(self):
-        if self.current_char() == '\n':
-            self.line += 1
-            self.column = 1
+        self.line_start = 0  # offset where the current line begins
+
+        # Character codes by position, so the scanners index ints instead of
+        # making a 1-char str and calling ord(). ASCII source maps one byte
+        # per character; anything else uses UTF-32 code units.
+        if source.isascii():
+            self.codes = source.encode('ascii')
         else:
-            self.column += 1
-        self.pos += 1
+            self.codes = memoryview(source.encode(UTF32_NATIVE, 'surrogatepass')).cast('I')
 
     def skip_whitespace(self):
-        while self.current_char() is not None and self.current_char() in ' \t\r':
-            self.advance()
+        self.pos = WHITESPACE_RE.match(self.source, self.pos).end()
 
-    def add_token(self, token_type, value, line, column):
-        self.tokens.append(Token(token_type, value, line, column))
+    def skip_newlines(self):
+        end = BLANK_RE.match(self.source, self.pos).end()
+        self.count_lines(self.pos, end)
+        self.pos = end
+
+    def count_lines(self, start, end):
+        # Move line/line_start past any newlines in source[start:end]
+        newlines = self.source.count('\n', start, end)
+        if newlines:
+            self.line += newlines
+            self.line_start = self.source.rfind('\n', start, end) + 1
+
+    def make_token(self, token_type, value, start_pos):
+        return Token(token_type, value, self.line, start_pos - self.line_start + 1)
 
     # ---------- NUMBER ----------
     def lex_number(self):
-        start_line = self.line
-        start_col = self.column
-        num_str = ""
+        source = self.source
+        codes = self.codes
+        n = len(source)
+        start_pos = pos = self.pos
         is_float = False
 
-        while self.current_char() is not None and (self.current_char().isdigit() or self.current_char() == '.'):
-            if self.current_char() == '.':
+        while pos < n:
+            code = codes[pos]
+            if code == 0x2E:  # '.'
                 if is_float:
                     break
                 is_float = True
-            num_str += self.current_char()
-            self.advance()
+            elif not (IS_DIGIT[code] if code < 256 else source[pos].isdigit()):
+                break
+            pos += 1
 
         token_type = "FLOAT" if is_float else "INTEGER"
-        self.add_token(token_type, num_str, start_line, start_col)
+        self.pos = pos
+        return self.make_token(token_type, source[start_pos:pos], start_pos)
 
     # ---------- IDENTIFIER / KEYWORD ----------
     def lex_identifier(self):
-        start_line = self.line
-        start_col = self.column
-        word = ""
+        start_pos = self.pos
+        match = IDENTIFIER_RE.match(self.source, start_pos)
+        word = match.group()
+        self.pos = start_pos + len(word)
 
-        while self.current_char() is not None and (self.current_char().isalnum() or self.current_char() == '_'):
-            word += self.current_char()
-            self.advance()
-
-        if word in TOKEN_TYPES["KEYWORD"]:
-            self.add_token("KEYWORD", word, start_line, start_col)
-        else:
-            self.add_token("IDENTIFIER", word, start_line, start_col)
+        if len(word) <= MAX_INTERNED_IDENTIFIER:
+            word = sys.intern(word)
+        return self.make_token(IDENTIFIER_TYPES[match.lastindex], word, start_pos)
 
     # ---------- STRING ----------
-    def lex_string(self, quote_char):
-        start_line = self.line
-        start_col = self.column
-        string_val = quote_char
-        self.advance()  # skip opening quote
-
-        while self.current_char() is not None and self.current_char() != quote_char:
-            if self.current_char() == '\\':
-                string_val += self.current_char()
-                self.advance()
-            if self.current_char() is not None:
-                string_val += self.current_char()
-                self.advance()
-
-        if self.current_char() == quote_char:
-            string_val += self.current_char()
-            self.advance()
-
-        self.add_token("STRING", string_val, start_line, start_col)
+    def lex_string(self):
+        source = self.source
+        n = len(source)
+        start_pos = self.pos
+        quote_char = source[start_pos]
+        pos = start_pos + 1  # skip opening quote
+
+        while True:
+            end = source.find(quote_char, pos)
+            if end < 0:
+                end = n
+                break
+            # The quote is escaped if an odd run of backslashes precedes it
+            k = end - 1
+            while source[k] == '\\':
+                k -= 1
+            if (end - 1 - k) % 2 == 0:
+                end += 1
+                break
+            pos = end + 1
+
+        token = self.make_token("STRING", source[start_pos:end], start_pos)
+        self.count_lines(start_pos, end)
+        self.pos = end
+        return token
 
     # ---------- SINGLE-LINE COMMENT ----------
     def lex_single_comment(self):
-        start_line = self.line
-        start_col = self.column
-        comment = ""
-
-        while self.current_char() is not None and self.current_char() != '\n':
-            comment += self.current_char()
-            self.advance()
+        source = self.source
+        start_pos = self.pos
+        end = source.find('\n', start_pos)
+        if end < 0:
+            end = len(source)
 
-        self.add_token("COMMENT", comment, start_line, start_col)
+        self.pos = end
+        return self.make_token("COMMENT", source[start_pos:end], start_pos)
 
     # ---------- MULTI-LINE COMMENT ----------
     def lex_multi_comment(self):
-        start_line = self.line
-        start_col = self.column
-        comment = "/*"
-        self.advance()  # skip '/'
-        self.advance()  # skip '*'
-
-        while self.current_char() is not None:
-            if self.current_char() == '*' and self.peek_char() == '/':
-                comment += "*/"
-                self.advance()
-                self.advance()
-                break
-            comment += self.current_char()
-            self.advance()
+        source = self.source
+        n = len(source)
+        start_pos = self.pos
+        end = source.find('*/', start_pos + 2)  # skip '/*'
+        end = n if end < 0 else end + 2
 
-        self.add_token("COMMENT", comment, start_line, start_col)
+        token = self.make_token("COMMENT", source[start_pos:end], start_pos)
+        self.count_lines(start_pos, end)
+        self.pos = end
+        return token
 
     # ---------- PREPROCESSOR ----------
     def lex_preprocessor(self):
-        start_line = self.line
-        start_col = self.column
-        directive = ""
-
-        while self.current_char() is not None and self.current_char() != '\n':
-            directive += self.current_char()
-            self.advance()
-
-        self.add_token("PREPROCESSOR", directive, start_line, start_col)
-
-    # ---------- NEWLINE ----------
-    def lex_newline(self):
-        start_line = self.line
-        start_col = self.column
-        self.add_token("NEWLINE", "\\n", start_line, start_col)
-        self.advance()
+        source = self.source
+        start_pos = self.pos
+        end = source.find('\n', start_pos)
+        if end < 0:
+            end = len(source)
+
+        self.pos = end
+        return self.make_token("PREPROCESSOR", source[start_pos:end], start_pos)
+
+    # ---------- '/' : COMMENT OR OPERATOR ----------
+    def lex_slash(self):
+        pos = self.pos
+        nxt = self.source[pos + 1:pos + 2]
+        if nxt == '/':
+            return self.lex_single_comment()
+        if nxt == '*':
+            return self.lex_multi_comment()
+
+        op = "/=" if nxt == '=' else "/"
+        self.pos = pos + len(op)
+        return self.make_token("OPERATOR", op, pos)
+
+    # ---------- '#' : PREPROCESSOR OR COMMENT ----------
+    def lex_hash(self):
+        # A C directive opens its line and names a directive (#include,
+        # #define, ...); any other '#' starts a Python-style comment.
+        source = self.source
+        pos = self.pos
+        if DIRECTIVE_RE.match(source, pos) and not source[self.line_start:pos].strip(' \t\r'):
+            return self.lex_preprocessor()
+        return self.lex_single_comment()
+
+    # ---------- OPERATOR ----------
+    def lex_operator(self):
+        source = self.source
+        pos = self.pos
+        follow = Lexer.OP2.get(source[pos])
+        if follow and source[pos + 1:pos + 2] in follow:
+            op = source[pos:pos + 2]
+        else:
+            op = source[pos]
+
+        self.pos = pos + len(op)
+        return self.make_token("OPERATOR", op, pos)
+
+    # ---------- DELIMITER ----------
+    def lex_delimiter(self):
+        pos = self.pos
+        self.pos = pos + 1
+        return self.make_token("DELIMITER", self.source[pos], pos)
+
+    # ---------- UNKNOWN ----------
+    def lex_unknown(self):
+        pos = self.pos
+        self.pos = pos + 1
+        return self.make_token("UNKNOWN", self.source[pos], pos)
+
+    # ---------- BEYOND LATIN-1 ----------
+    def lex_other(self):
+        ch = self.source[self.pos]
+        if ch.isdigit():
+            return self.lex_number()
+        if ch.isalpha():
+            return self.lex_identifier()
+        return self.lex_unknown()
 
     # ==================== MAIN TOKENIZE ====================
-    def tokenize(self):
-        multi_char_ops = [
-            "==", "!=", "<=", ">=", "&&", "||", "++", "--",
-            "+=", "-=", "*=", "/=", "<<", ">>", "->", "**", "//",
-        ]
+    def iter_tokens(self):
+        # Yield tokens as they are scanned, without holding the whole list.
+        # Whitespace handlers return None and produce nothing.
+        source = self.source
+        n = len(source)
+        codes = self.codes
+        dispatch = Lexer.DISPATCH
+        lex_other = Lexer.lex_other
+
+        while self.pos < n:
+            code = codes[self.pos]
+            handler = dispatch[code] if code < 256 else lex_other
+            token = handler(self)
+            if token is not None:
+                yield token
 
-        single_ops = set("+-*/%=<>!&|^~?:@")
-        delimiters = set("(){}[];,.")
-
-        while self.pos < len(self.source):
-            self.skip_whitespace()
-            ch = self.current_char()
-
-            if ch is None:
-                break
-
-            # --- Newline ---
-            if ch == '\n':
-                self.lex_newline()
-                continue
-
-            # --- Preprocessor ---
-            if ch == '#':
-                self.lex_preprocessor()
-                continue
-
-            # --- Comments ---
-            if ch == '/' and self.peek_char() == '/':
-                self.lex_single_comment()
-                continue
-            if ch == '/' and self.peek_char() == '*':
-                self.lex_multi_comment()
-                continue
-            # Python single-line comment
-            if ch == '#':
-                self.lex_single_comment()
-                continue
-
-            # --- Numbers ---
-            if ch.isdigit():
-                self.lex_number()
-                continue
-
-            # --- Identifiers / Keywords ---
-            if ch.isalpha() or ch == '_':
-                self.lex_identifier()
-                continue
-
-            # --- Strings ---
-            if ch in ('"', "'"):
-                self.lex_string(ch)
-                continue
-
-            # --- Multi-character operators ---
-            if self.peek_char() is not None:
-                two_char = ch + self.peek_char()
-                if two_char in multi_char_ops:
-                    self.add_token("OPERATOR", two_char, self.line, self.column)
-                    self.advance()
-                    self.advance()
-                    continue
-
-            # --- Single-character operators ---
-            if ch in single_ops:
-                self.add_token("OPERATOR", ch, self.line, self.column)
-                self.advance()
-                continue
-
-            # --- Delimiters ---
-            if ch in delimiters:
-                self.add_token("DELIMITER", ch, self.line, self.column)
-                self.advance()
-                continue
-
-            # --- Unknown ---
-            self.add_token("UNKNOWN", ch, self.line, self.column)
-            self.advance()
-
-        return self.tokens
+    def tokenize(self):
+        return list(self.iter_tokens())
+
+# First-character dispatch shared by every Lexer: code -> handler for the
+# token that starts there, called with the lexer. Characters beyond
+# Latin-1 go through Lexer.lex_other instead.
+def build_dispatch():
+    dispatch = [Lexer.lex_unknown] * 256
+    for code in range(256):
+        ch = chr(code)
+        if IS_DIGIT[code]:
+            dispatch[code] = Lexer.lex_number
+        elif IS_IDENT_START[code]:
+            dispatch[code] = Lexer.lex_identifier
+        elif ch in Lexer.SINGLE_OPS:
+            dispatch[code] = Lexer.lex_operator
+        elif ch in Lexer.DELIMITERS:
+            dispatch[code] = Lexer.lex_delimiter
+    for ch in " \t\r":
+        dispatch[ord(ch)] = Lexer.skip_whitespace
+    dispatch[ord('\n')] = Lexer.skip_newlines
+    dispatch[ord('#')] = Lexer.lex_hash
+    dispatch[ord('/')] = Lexer.lex_slash
+    for ch in "\"'":
+        dispatch[ord(ch)] = Lexer.lex_string
+    return dispatch
+
+Lexer.DISPATCH = build_dispatch()
 
 # ==================== DISPLAY RESULTS (CLI) ====================
 def display_tokens(tokens, source_name="input"):
@@ -257,8 +336,6 @@ def display_tokens(tokens, source_name="input"):
     type_count = {}
 
     for token in tokens:
-        if token.type == "NEWLINE":
-            continue  # skip newline tokens in display
         print(token)
         type_count[token.type] = type_count.get(token.type, 0) + 1
 